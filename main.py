@@ -5,15 +5,31 @@ Contains the game loop and main menu system.
 import random
 import json
 import os
+import sys
 from typing import Optional
 
+try:
+    import orjson  # C-extension JSON, used for saves when available
+except ImportError:
+    orjson = None
+
 from player import Player
-from spell import ALL_SPELLS, Spell
-from npcs import TRAINING_DUMMY, STUDENT_DUELIST, DARK_WIZARD, NPC
-from utils import clear_screen, get_valid_input, sorting_hat_quiz, generate_random_event
+from spell import ALL_SPELLS, Spell, get_spell
+import npcs
+from npcs import NPC
+from utils import clear_screen, get_valid_input, get_int_in_range, sorting_hat_quiz, generate_random_event
 
 SAVE_FILE = "savegame.json"
 
+# Duel opponents: display name paired with the lazy attribute in npcs.
+# Holding names rather than instances keeps each duel's NPC fresh.
+_OPPONENTS = (
+    ("Training Dummy", "TRAINING_DUMMY"),
+    ("Student Duelist", "STUDENT_DUELIST"),
+    ("Dark Wizard", "DARK_WIZARD"),
+)
+_OPPONENT_CHOICES = ("1", "2", "3")
+
 
 class HogwartsRPG:
     """Main game class that handles the game loop and state."""
@@ -30,8 +46,13 @@ class HogwartsRPG:
             
         save_data = self.player.to_dict()
         try:
-            with open(SAVE_FILE, 'w') as f:
-                json.dump(save_data, f)
+            if orjson is not None:
+                with open(SAVE_FILE, 'wb') as f:
+                    f.write(orjson.dumps(save_data))
+            else:
+                # Compact separators and a large buffer keep writes small and few
+                with open(SAVE_FILE, 'w', buffering=65536) as f:
+                    json.dump(save_data, f, separators=(',', ':'), ensure_ascii=False)
             print("Game saved successfully!")
         except Exception as e:
             print(f"Error saving game: {e}")
@@ -43,8 +64,9 @@ class HogwartsRPG:
             return False
             
         try:
-            with open(SAVE_FILE, 'r') as f:
-                save_data = json.load(f)
+            with open(SAVE_FILE, 'rb') as f:
+                raw = f.read()
+            save_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
             self.player = Player.from_dict(save_data)
             print("Game loaded successfully!")
             return True
@@ -69,7 +91,7 @@ class HogwartsRPG:
         
         self.player = Player(name, house)
         # Give the player their first spell
-        self.player.learn_spell(ALL_SPELLS["lumos"])
+        self.player.learn_spell(get_spell("lumos"))
         
         # Show initial stats
         self.show_stats()
@@ -80,16 +102,21 @@ class HogwartsRPG:
             return
         
         stats = self.player.get_stats()
-        print("\n=== Character Stats ===")
-        print(f"Name: {stats['Name']}")
-        print(f"House: {stats['House']}")
-        print(f"Health: {stats['Health']}")
-        print(f"Mana: {stats['Mana']}")
-        print(f"Knowledge: {stats['Knowledge']}")
-        print(f"House Points: {stats['House Points']}")
-        print("\nKnown Spells:")
-        for spell in stats['Known Spells']:
-            print(f"- {spell}")
+        health, max_health = stats['Health']
+        mana, max_mana = stats['Mana']
+        # Build the whole block and write it once instead of a print per line
+        lines = [
+            "\n=== Character Stats ===",
+            f"Name: {stats['Name']}",
+            f"House: {stats['House']}",
+            f"Health: {health}/{max_health}",
+            f"Mana: {mana}/{max_mana}",
+            f"Knowledge: {stats['Knowledge']}",
+            f"House Points: {stats['House Points']}",
+            "\nKnown Spells:",
+        ]
+        lines.extend(f"- {spell}" for spell in stats['Known Spells'])
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def attend_class(self) -> None:
         """Simulate attending a class to learn new spells."""
@@ -102,7 +129,7 @@ class HogwartsRPG:
         # Random chance to learn a new spell
         available_spells = [
             spell for spell in ALL_SPELLS.values()
-            if spell not in self.player.known_spells
+            if not self.player.knows_spell(spell.name)
         ]
         
         if not available_spells:
@@ -128,12 +155,13 @@ class HogwartsRPG:
             return
         
         # Show available spells
+        spells = self.player.known_spells
         print("\nAvailable spells:")
-        for i, spell in enumerate(self.player.known_spells, 1):
+        for i, spell in enumerate(spells, 1):
             print(f"{i}. {spell.name}")
-        
-        choice = get_valid_input("\nChoose a spell (number): ", [str(i) for i in range(1, len(self.player.known_spells) + 1)])
-        spell = list(self.player.known_spells)[int(choice) - 1]
+
+        choice = get_int_in_range("\nChoose a spell (number): ", 1, len(spells))
+        spell = spells[choice - 1]
         
         damage, effect = spell.cast(self.player)
         print(f"\nYou cast {spell.name}!")
@@ -168,19 +196,13 @@ class HogwartsRPG:
         clear_screen()
         print("=== Wizard's Duel ===")
         
-        # Choose opponent
-        opponents = {
-            "1": TRAINING_DUMMY,
-            "2": STUDENT_DUELIST,
-            "3": DARK_WIZARD
-        }
-        
         print("Choose your opponent:")
-        for num, npc in opponents.items():
-            print(f"{num}. {npc.name}")
-        
-        choice = get_valid_input("Your choice (1-3): ", list(opponents.keys()))
-        opponent = opponents[choice]
+        for i, (name, _) in enumerate(_OPPONENTS, 1):
+            print(f"{i}. {name}")
+
+        choice = get_valid_input("Your choice (1-3): ", _OPPONENT_CHOICES)
+        # Only the chosen NPC is constructed, fresh for this duel
+        opponent = getattr(npcs, _OPPONENTS[int(choice) - 1][1])
         self._run_duel(opponent)
     
     def _run_duel(self, opponent: NPC) -> None:
@@ -188,17 +210,18 @@ class HogwartsRPG:
         print(f"\nDuel start! {self.player.name} vs {opponent.name}")
         
         while self.player.is_alive() and opponent.is_alive():
-            # Player's turn
-            print(f"\nYour HP: {self.player.health}/{self.player.max_health}")
-            print(f"Opponent HP: {opponent.health}/{opponent.max_health}")
-            print("\nYour turn! Choose a spell:")
-            
-            # Show available spells
-            for i, spell in enumerate(self.player.known_spells, 1):
-                print(f"{i}. {spell.name}")
-            
-            choice = get_valid_input("Choose a spell (number): ", [str(i) for i in range(1, len(self.player.known_spells) + 1)])
-            spell = list(self.player.known_spells)[int(choice) - 1]
+            # Player's turn: render HP and spell list in one write
+            spells = self.player.known_spells
+            lines = [
+                f"\nYour HP: {self.player.health}/{self.player.max_health}",
+                f"Opponent HP: {opponent.health}/{opponent.max_health}",
+                "\nYour turn! Choose a spell:",
+            ]
+            lines.extend(f"{i}. {spell.name}" for i, spell in enumerate(spells, 1))
+            sys.stdout.write("\n".join(lines) + "\n")
+
+            choice = get_int_in_range("Choose a spell (number): ", 1, len(spells))
+            spell = spells[choice - 1]
             
             damage, effect = spell.cast(self.player, opponent)
             
@@ -247,14 +270,12 @@ class HogwartsRPG:
         while self.running:
             clear_screen()
             print("=== Hogwarts RPG ===")
-            
+
             if not self.player:
-                print("\n1. Start New Game")
-                print("2. Load Game")
-                print("3. Quit")
-                
+                sys.stdout.write("\n1. Start New Game\n2. Load Game\n3. Quit\n")
+
                 choice = get_valid_input("\nChoose an option (1-3): ", ["1", "2", "3"])
-                
+
                 if choice == "1":
                     self.start_new_game()
                 elif choice == "2":
@@ -262,16 +283,13 @@ class HogwartsRPG:
                 elif choice == "3":
                     self.running = False
             else:
-                print("\n1. Explore Hogwarts")
-                print("2. Attend Class")
-                print("3. Cast Spell")
-                print("4. Duel")
-                print("5. View Stats")
-                print("6. Save Game")
-                print("7. Quit")
-                
+                sys.stdout.write(
+                    "\n1. Explore Hogwarts\n2. Attend Class\n3. Cast Spell\n"
+                    "4. Duel\n5. View Stats\n6. Save Game\n7. Quit\n"
+                )
+
                 choice = get_valid_input("\nChoose an option (1-7): ", [str(i) for i in range(1, 8)])
-                
+
                 if choice == "1":
                     self.explore()
                 elif choice == "2":
@@ -2,14 +2,55 @@
 NPC system for the Harry Potter RPG game.
 Contains the base NPC class and specific NPC implementations.
 """
+import bisect
 import random
-from typing import List, Optional
+from enum import IntFlag
+from typing import Dict, List, Optional
 from spell import Spell, ALL_SPELLS
 
 
+class Status(IntFlag):
+    """Bit flags for the status effects a character can carry."""
+    SHIELD = 1
+    STUN = 2
+    DISARM = 4
+    KNOCKBACK = 8
+
+
+# Effect name (as passed to apply_effect) -> status flag
+_EFFECT_FLAGS = {
+    "shield": Status.SHIELD,
+    "stun": Status.STUN,
+    "disarm": Status.DISARM,
+    "knockback": Status.KNOCKBACK,
+}
+
+# Status flag -> display name shown in stats panels
+_EFFECT_NAMES = {
+    Status.SHIELD: "Shield",
+    Status.STUN: "Stunned",
+    Status.DISARM: "Disarmed",
+    Status.KNOCKBACK: "Knocked Back",
+}
+
+# Materialized once so each NPC construction samples from a shared tuple
+# instead of rebuilding a list of all spell values.
+_ALL_SPELLS_TUPLE = tuple(ALL_SPELLS.values())
+
+# Difficulty tables shared across NPC constructions
+_HEALTH_MAP = {"easy": 80, "normal": 100, "hard": 120}
+_MANA_MAP = {"easy": 80, "normal": 100, "hard": 120}
+_SPELL_COUNT = {"easy": 2, "normal": 3, "hard": 4}
+
+
 class Character:
     """Base class for all characters (players and NPCs)."""
-    
+
+    __slots__ = (
+        "name", "max_health", "max_mana", "health", "mana",
+        "known_spells", "_spell_index", "status",
+    )
+
     def __init__(self, name: str, max_health: int = 100, max_mana: int = 100):
         self.name = name
         self.max_health = max_health
@@ -17,21 +58,20 @@ class Character:
         self.health = max_health
         self.mana = max_mana
         self.known_spells: List[Spell] = []
+        # Mirrors known_spells keyed by spell name for O(1) membership/lookup;
+        # name keys stay correct even across save/load round-trips
+        self._spell_index: Dict[str, Spell] = {}
         
-        # Status effects
-        self.shield_active = False
-        self.is_stunned = False
-        self.is_disarmed = False
-        self.is_knocked_back = False
-        self.status_effects = []  # List of active effects
+        # Active status effects, packed into one bitmask
+        self.status = Status(0)
     
     def is_alive(self) -> bool:
         """Check if the character is still alive."""
         return self.health > 0
-    
-    def take_damage(self, amount: int) -> None:
-        """Take damage, ensuring health doesn't go below 0."""
-        self.health = max(0, self.health - amount)
+
+    def knows_spell(self, name: str) -> bool:
+        """Check whether the character knows a spell by name."""
+        return name in self._spell_index
     
     def heal(self, amount: int) -> None:
         """Heal the character, not exceeding max health."""
@@ -43,51 +83,59 @@ class Character:
     
     def apply_effect(self, effect: str) -> None:
         """Apply a status effect to the character."""
-        if effect == "shield":
-            self.shield_active = True
-            self.status_effects.append("Shield")
-        elif effect == "stun":
-            self.is_stunned = True
-            self.status_effects.append("Stunned")
-        elif effect == "disarm":
-            self.is_disarmed = True
-            self.status_effects.append("Disarmed")
-        elif effect == "knockback":
-            self.is_knocked_back = True
-            self.status_effects.append("Knocked Back")
-    
+        flag = _EFFECT_FLAGS.get(effect)
+        if flag is not None:
+            self.status |= flag
+
     def clear_effects(self) -> None:
         """Clear all status effects."""
-        self.shield_active = False
-        self.is_stunned = False
-        self.is_disarmed = False
-        self.is_knocked_back = False
-        self.status_effects.clear()
-    
+        self.status = Status(0)
+
     def get_status_effects(self) -> List[str]:
         """Get list of active status effects."""
-        return self.status_effects
-    
+        return [name for flag, name in _EFFECT_NAMES.items() if self.status & flag]
+
+    @property
+    def shield_active(self) -> bool:
+        """Whether a shield effect is currently active."""
+        return bool(self.status & Status.SHIELD)
+
+    @property
+    def is_stunned(self) -> bool:
+        """Whether the character is stunned."""
+        return bool(self.status & Status.STUN)
+
+    @property
+    def is_disarmed(self) -> bool:
+        """Whether the character is disarmed."""
+        return bool(self.status & Status.DISARM)
+
+    @property
+    def is_knocked_back(self) -> bool:
+        """Whether the character is knocked back."""
+        return bool(self.status & Status.KNOCKBACK)
+
     def take_damage(self, amount: int) -> int:
         """
         Take damage, considering shield effect.
         Returns the actual damage taken.
         """
-        if self.shield_active:
-            # Shield reduces damage by 50%
+        if self.status & Status.SHIELD:
+            # Shield reduces damage by 50% and breaks after use
             actual_damage = amount // 2
-            self.shield_active = False  # Shield breaks after use
-            self.status_effects.remove("Shield")
+            self.status &= ~Status.SHIELD
         else:
             actual_damage = amount
-            
+
         self.health = max(0, self.health - actual_damage)
         return actual_damage
 
 
 class NPC(Character):
     """Class representing non-player characters that can be dueled."""
-    
+
+    __slots__ = ("_mana_costs",)
+
     def __init__(self, name: str, difficulty: str = "normal"):
         """
         Initialize an NPC with given difficulty level.
@@ -97,26 +145,39 @@ class NPC(Character):
             difficulty: "easy", "normal", or "hard"
         """
         # Adjust stats based on difficulty
-        health_map = {"easy": 80, "normal": 100, "hard": 120}
-        mana_map = {"easy": 80, "normal": 100, "hard": 120}
-        
         super().__init__(
             name=name,
-            max_health=health_map.get(difficulty, 100),
-            max_mana=mana_map.get(difficulty, 100)
+            max_health=_HEALTH_MAP.get(difficulty, 100),
+            max_mana=_MANA_MAP.get(difficulty, 100)
         )
-        
+
         # Give the NPC some spells based on difficulty
-        spell_count = {"easy": 2, "normal": 3, "hard": 4}
-        self.known_spells = random.sample(list(ALL_SPELLS.values()), spell_count.get(difficulty, 3))
-    
+        self.known_spells = random.sample(_ALL_SPELLS_TUPLE, _SPELL_COUNT.get(difficulty, 3))
+        self._spell_index = {spell.name: spell for spell in self.known_spells}
+        # Keep spells sorted by cost so choose_spell can find the castable
+        # prefix with a binary search instead of filtering every turn
+        self.known_spells.sort(key=lambda s: s.mana_cost)
+        self._mana_costs = [s.mana_cost for s in self.known_spells]
+
     def choose_spell(self) -> Optional[Spell]:
         """Choose a random spell that the NPC can cast."""
-        castable_spells = [spell for spell in self.known_spells if spell.mana_cost <= self.mana]
-        return random.choice(castable_spells) if castable_spells else None
+        castable = bisect.bisect_right(self._mana_costs, self.mana)
+        return self.known_spells[random.randrange(castable)] if castable else None
+
+
+# Pre-defined NPCs for dueling, constructed lazily (PEP 562) so importing
+# this module just for Character doesn't pay for NPC construction.
+# Each attribute access builds a fresh NPC, so opponents don't carry
+# damaged health/mana from one duel into the next.
+_PREDEFINED_NPCS = {
+    "TRAINING_DUMMY": ("Training Dummy", "easy"),
+    "STUDENT_DUELIST": ("Student Duelist", "normal"),
+    "DARK_WIZARD": ("Dark Wizard", "hard"),
+}
 
 
-# Pre-defined NPCs for dueling
-TRAINING_DUMMY = NPC("Training Dummy", "easy")
-STUDENT_DUELIST = NPC("Student Duelist", "normal")
-DARK_WIZARD = NPC("Dark Wizard", "hard")
\ No newline at end of file
+def __getattr__(name: str) -> NPC:
+    if name in _PREDEFINED_NPCS:
+        npc_name, difficulty = _PREDEFINED_NPCS[name]
+        return NPC(npc_name, difficulty)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
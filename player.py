@@ -2,14 +2,19 @@
 Player system for the Harry Potter RPG game.
 Contains the Player class which extends the base Character class.
 """
-from typing import List, Dict, Any
+from array import array
+from collections import Counter
+from typing import List, Dict, Any, Optional
 from npcs import Character
-from spell import Spell
+from spell import Spell, get_spell
 
 
 class Player(Character):
     """Class representing the player character."""
-    
+
+    __slots__ = ("house", "knowledge", "house_points", "inventory",
+                 "_stats_key", "_stats_cache", "_spell_costs", "_spell_damages")
+
     def __init__(self, name: str, house: str):
         """
         Initialize a new player.
@@ -19,21 +24,57 @@ class Player(Character):
             house: Hogwarts house (Gryffindor, Slytherin, Hufflepuff, or Ravenclaw)
         """
         # Apply house-based stat bonuses
-        house_bonuses = {
-            "gryffindor": {"health": 120, "mana": 100},  # Brave - more health
-            "slytherin": {"health": 100, "mana": 120},   # Cunning - more mana
-            "hufflepuff": {"health": 110, "mana": 110},  # Balanced
-            "ravenclaw": {"health": 90, "mana": 130},    # Wise - most mana
-        }
-        
-        stats = house_bonuses.get(house.lower(), {"health": 100, "mana": 100})
-        super().__init__(name=name, max_health=stats["health"], max_mana=stats["mana"])
+        match house.lower():
+            case "gryffindor":
+                max_health, max_mana = 120, 100  # Brave - more health
+            case "slytherin":
+                max_health, max_mana = 100, 120  # Cunning - more mana
+            case "hufflepuff":
+                max_health, max_mana = 110, 110  # Balanced
+            case "ravenclaw":
+                max_health, max_mana = 90, 130   # Wise - most mana
+            case _:
+                max_health, max_mana = 100, 100
+        super().__init__(name=name, max_health=max_health, max_mana=max_mana)
         
         self.house = house
         self.knowledge = 0
         self.house_points = 0
-        self.inventory: List[str] = ["Wand", "Textbooks"]
+        # Counter so stacking duplicate items (potion ingredients etc.)
+        # is a hash update instead of a list scan
+        self.inventory: Counter = Counter({"Wand": 1, "Textbooks": 1})
+
+        # Memoized get_stats result plus the state snapshot it was built from
+        self._stats_key: Any = None
+        self._stats_cache: Dict[str, Any] = {}
+
+        # Spell stats mirrored into packed int columns, kept in step with
+        # known_spells, so numeric queries scan a flat buffer instead of
+        # touching one Spell object per entry
+        self._spell_costs = array('i')
+        self._spell_damages = array('i')
     
+    def __copy__(self) -> 'Player':
+        """
+        Return an independent clone of this player.
+
+        Copies the slotted fields directly and duplicates the mutable
+        containers, so cloning skips __init__ entirely while keeping the
+        clone's state detached from the original.
+        """
+        clone = self.__class__.__new__(self.__class__)
+        for cls in type(self).__mro__:
+            for slot in getattr(cls, "__slots__", ()):
+                setattr(clone, slot, getattr(self, slot))
+        clone.known_spells = list(self.known_spells)
+        clone._spell_index = dict(self._spell_index)
+        clone.inventory = Counter(self.inventory)
+        clone._stats_key = None
+        clone._stats_cache = {}
+        clone._spell_costs = array('i', self._spell_costs)
+        clone._spell_damages = array('i', self._spell_damages)
+        return clone
+
     def learn_spell(self, spell: Spell) -> bool:
         """
         Learn a new spell if not already known.
@@ -41,11 +82,36 @@ class Player(Character):
         Returns:
             bool: True if spell was learned, False if already known
         """
-        if spell not in self.known_spells:
+        if spell.name not in self._spell_index:
+            self._spell_index[spell.name] = spell
             self.known_spells.append(spell)
+            self._spell_costs.append(spell.mana_cost)
+            self._spell_damages.append(spell.damage)
             return True
         return False
     
+    def best_affordable_spell(self) -> Optional[Spell]:
+        """
+        Return the highest-damage spell the player can currently afford.
+
+        Scans the packed cost/damage columns rather than the Spell
+        objects themselves.
+
+        Returns:
+            Optional[Spell]: The best castable spell, or None if no
+            spell is affordable
+        """
+        mana = self.mana
+        costs = self._spell_costs
+        damages = self._spell_damages
+        best_damage = -1
+        best_index = -1
+        for i in range(len(costs)):
+            if costs[i] <= mana and damages[i] > best_damage:
+                best_damage = damages[i]
+                best_index = i
+        return self.known_spells[best_index] if best_index >= 0 else None
+
     def gain_knowledge(self, amount: int) -> None:
         """Gain knowledge points from attending classes."""
         self.knowledge += amount
@@ -55,18 +121,35 @@ class Player(Character):
         self.house_points += points
     
     def get_stats(self) -> Dict[str, Any]:
-        """Get all player stats as a dictionary."""
-        return {
-            "Name": self.name,
-            "House": self.house,
-            "Health": f"{self.health}/{self.max_health}",
-            "Mana": f"{self.mana}/{self.max_mana}",
-            "Knowledge": self.knowledge,
-            "House Points": self.house_points,
-            "Known Spells": [spell.name for spell in self.known_spells],
-            "Inventory": self.inventory,
-            "Status Effects": self.get_status_effects()
-        }
+        """
+        Get all player stats as a dictionary.
+
+        The result is cached between calls and only rebuilt when the
+        underlying state changes, so UI refresh ticks with nothing new
+        cost a single tuple comparison. Callers must treat the returned
+        dictionary as read-only.
+        """
+        # Comparing a snapshot tuple also catches direct attribute writes
+        # (e.g. Spell.cast deducting caster.mana) that bypass the mutators
+        key = (
+            self.health, self.max_health, self.mana, self.max_mana,
+            self.knowledge, self.house_points, self.status,
+            len(self.known_spells), tuple(self.inventory.items()),
+        )
+        if key != self._stats_key:
+            self._stats_cache = {
+                "Name": self.name,
+                "House": self.house,
+                "Health": (self.health, self.max_health),
+                "Mana": (self.mana, self.max_mana),
+                "Knowledge": self.knowledge,
+                "House Points": self.house_points,
+                "Known Spells": list(self._spell_index),
+                "Inventory": list(self.inventory.elements()),
+                "Status Effects": self.get_status_effects()
+            }
+            self._stats_key = key
+        return self._stats_cache
         
     def to_dict(self) -> Dict[str, Any]:
         """Convert player state to a dictionary for saving."""
@@ -79,15 +162,13 @@ class Player(Character):
             "max_mana": self.max_mana,
             "knowledge": self.knowledge,
             "house_points": self.house_points,
-            "inventory": self.inventory,
-            "known_spells": [spell.name for spell in self.known_spells]
+            "inventory": dict(self.inventory),
+            "known_spells": list(self._spell_index)
         }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Player':
         """Create a player instance from saved data."""
-        from spell import ALL_SPELLS  # Import here to avoid circular imports
-        
         player = cls(data["name"], data["house"])
         player.health = data["health"]
         player.max_health = data["max_health"]
@@ -95,11 +176,14 @@ class Player(Character):
         player.max_mana = data["max_mana"]
         player.knowledge = data["knowledge"]
         player.house_points = data["house_points"]
-        player.inventory = data["inventory"]
+        # Older saves stored the inventory as a flat list; Counter accepts both
+        player.inventory = Counter(data["inventory"])
         
-        # Restore known spells
+        # Restore known spells; get_spell resolves the display names
+        # stored by to_dict regardless of case
         for spell_name in data["known_spells"]:
-            if spell_name in ALL_SPELLS:
-                player.known_spells.append(ALL_SPELLS[spell_name])
+            spell = get_spell(spell_name)
+            if spell is not None:
+                player.learn_spell(spell)
                 
         return player
\ No newline at end of file
@@ -0,0 +1,112 @@
+"""
+Offline balance-simulation tools for the Harry Potter RPG game.
+Runs batches of scripted duels over plain numeric state so spell and
+difficulty tuning can be measured without the interactive duel loop.
+"""
+import random
+from typing import List, Tuple
+
+from npcs import Character
+
+
+def resolve_turn(hp: List[int], mana: List[int], shield: List[int],
+                 dmg: List[int], cost: List[int]) -> None:
+    """
+    Resolve one attack step across a batch of duels in place.
+
+    Each index is one duel: the attacker spends cost[i] mana (skipping
+    the turn if it can't afford the spell) and the defender's hp[i] is
+    reduced by dmg[i], halved once if shield[i] is set.
+
+    Args:
+        hp: Defender health per duel, mutated in place
+        mana: Attacker mana per duel, mutated in place
+        shield: Defender shield flags (1 = active) per duel, mutated in place
+        dmg: Damage of the spell cast in each duel
+        cost: Mana cost of the spell cast in each duel
+    """
+    for i in range(len(hp)):
+        if mana[i] < cost[i]:
+            continue
+        mana[i] -= cost[i]
+        hit = dmg[i]
+        if shield[i]:
+            hit //= 2
+            shield[i] = 0
+        remaining = hp[i] - hit
+        hp[i] = remaining if remaining > 0 else 0
+
+
+def resolve_batch(caster_mana: int, costs: List[int], damages: List[int],
+                  targets_hp: List[int]) -> int:
+    """
+    Resolve one caster attacking a crowd of targets in sequence.
+
+    For each target i the caster spends costs[i] mana (skipping targets
+    it can no longer afford a spell for) and targets_hp[i] is reduced by
+    damages[i], floored at zero.
+
+    Args:
+        caster_mana: The caster's starting mana
+        costs: Mana cost of the spell aimed at each target
+        damages: Damage of the spell aimed at each target
+        targets_hp: Target health values, mutated in place
+
+    Returns:
+        int: The caster's remaining mana
+    """
+    for i in range(len(targets_hp)):
+        cost = costs[i]
+        if caster_mana < cost:
+            continue
+        caster_mana -= cost
+        remaining = targets_hp[i] - damages[i]
+        targets_hp[i] = remaining if remaining > 0 else 0
+    return caster_mana
+
+
+def batch_simulate_duel(player: Character, opponent: Character,
+                        n_trials: int = 1000, max_turns: int = 100) -> float:
+    """
+    Estimate the player's win rate against an opponent over many duels.
+
+    Both sides pick random affordable spells each turn, mirroring the
+    NPC AI, so the result reflects raw stat balance rather than tactics.
+
+    Args:
+        player: Character whose win rate is measured
+        opponent: Character to duel against
+        n_trials: Number of duels to simulate
+        max_turns: Turn cap per duel (unfinished duels count as losses)
+
+    Returns:
+        float: Fraction of duels the player won
+    """
+    player_spells = [(s.damage, s.mana_cost) for s in player.known_spells]
+    opponent_spells = [(s.damage, s.mana_cost) for s in opponent.known_spells]
+    if not player_spells:
+        return 0.0
+
+    wins = 0
+    for _ in range(n_trials):
+        p_hp, p_mana = player.max_health, player.max_mana
+        o_hp, o_mana = opponent.max_health, opponent.max_mana
+
+        for _ in range(max_turns):
+            dmg, cost = random.choice(player_spells)
+            if p_mana >= cost:
+                p_mana -= cost
+                o_hp -= dmg
+                if o_hp <= 0:
+                    wins += 1
+                    break
+
+            if opponent_spells:
+                dmg, cost = random.choice(opponent_spells)
+                if o_mana >= cost:
+                    o_mana -= cost
+                    p_hp -= dmg
+                    if p_hp <= 0:
+                        break
+
+    return wins / n_trials
@@ -2,12 +2,26 @@
 Spell system for the Harry Potter RPG game.
 Contains the base Spell class and implementations of specific spells.
 """
+import functools
+import sys
+import types
 from typing import Optional
 
 
+# Shared (damage, effect) results for the failure/special paths of cast(),
+# so no tuple is allocated per cast
+_NO_MANA = (0, "Not enough mana!")
+_STUNNED = (0, "Cannot cast while stunned!")
+_DISARMED = (0, "Cannot cast offensive spells while disarmed!")
+_HEALING = (0, "healing")
+
+
 class Spell:
     """Base class for all spells in the game."""
-    
+
+    __slots__ = ("name", "mana_cost", "description", "damage", "effect",
+                 "_result", "_str")
+
     def __init__(self, name: str, mana_cost: int, description: str, damage: int = 0, effect: Optional[str] = None):
         """
         Initialize a new spell.
@@ -19,15 +33,29 @@ class Spell:
             damage: Amount of damage the spell deals (if any)
             effect: Special effect the spell has (if any)
         """
-        self.name = name
+        # Interned names/effects make the frequent dict probes and string
+        # comparisons on these values hit CPython's identity fast path
+        self.name = sys.intern(name)
         self.mana_cost = mana_cost
         self.description = description
         self.damage = damage
-        self.effect = effect
-    
+        self.effect = sys.intern(effect) if effect is not None else None
+        # Success result of cast() and display string, built once since
+        # spells never change
+        self._result = (self.damage, self.effect)
+        self._str = f"{self.name} (Mana: {self.mana_cost}) - {self.description}"
+
     def __str__(self) -> str:
         """Return a string representation of the spell."""
-        return f"{self.name} (Mana: {self.mana_cost}) - {self.description}"
+        return self._str
+
+    def __eq__(self, other: object) -> bool:
+        """Spells are equal when they share a name; names are unique."""
+        return isinstance(other, Spell) and other.name == self.name
+
+    def __hash__(self) -> int:
+        """Hash by name, matching __eq__, so spells work as set/dict keys."""
+        return hash(self.name)
     
     def cast(self, caster: 'Character', target: Optional['Character'] = None) -> tuple[int, Optional[str]]:
         """
@@ -41,26 +69,26 @@ class Spell:
             Tuple of (damage_dealt, effect_applied)
         """
         if caster.mana < self.mana_cost:
-            return 0, "Not enough mana!"
-        
+            return _NO_MANA
+
         if caster.is_stunned:
-            return 0, "Cannot cast while stunned!"
-            
+            return _STUNNED
+
         if caster.is_disarmed and self.damage > 0:
-            return 0, "Cannot cast offensive spells while disarmed!"
-        
+            return _DISARMED
+
         caster.mana -= self.mana_cost
-        
+
         # Apply effects
         if self.effect and target:
             target.apply_effect(self.effect)
-            
+
             # Special handling for healing spells
             if self.effect == "heal":
                 target.heal(30)  # Heal for a fixed amount
-                return 0, "healing"
-                
-        return self.damage, self.effect
+                return _HEALING
+
+        return self._result
 
 
 # Pre-defined spells
@@ -109,8 +137,24 @@ EPISKEY = Spell(
     effect="heal"
 )
 
-# Dictionary of all available spells
-ALL_SPELLS = {
-    spell.name.lower(): spell
+# Read-only dictionary of all available spells, keyed by interned lowercase name
+ALL_SPELLS = types.MappingProxyType({
+    sys.intern(spell.name.lower()): spell
     for spell in [LUMOS, EXPELLIARMUS, STUPEFY, PROTEGO, FLIPENDO, EPISKEY]
-}
\ No newline at end of file
+})
+
+@functools.lru_cache(maxsize=256)
+def get_spell(name: str) -> Optional[Spell]:
+    """
+    Look up a spell by name, case-insensitively.
+
+    Memoized so repeated resolutions of the same name skip the lower()
+    normalization and table probe.
+
+    Args:
+        name: Spell name in any case (e.g. "Lumos" or "lumos")
+
+    Returns:
+        Optional[Spell]: The matching spell, or None if unknown
+    """
+    return ALL_SPELLS.get(name.lower())
\ No newline at end of file
@@ -2,6 +2,7 @@
 Unit tests for the Hogwarts RPG game.
 """
 import unittest
+import copy
 import os
 import json
 from player import Player
@@ -10,8 +11,13 @@ from npcs import TRAINING_DUMMY
 from main import HogwartsRPG, SAVE_FILE
 
 class TestHogwartsRPG(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._template = Player("Test Wizard", "Gryffindor")
+
     def setUp(self):
-        self.player = Player("Test Wizard", "Gryffindor")
+        # Clone the pristine template instead of re-running Player.__init__
+        self.player = copy.copy(self._template)
     
     def test_player_creation(self):
         """Test that player is created with correct initial values."""
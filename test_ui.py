@@ -28,18 +28,18 @@ class TestHogwartsUI(unittest.TestCase):
         self.assertTrue(hasattr(self.ui, 'input_entry'))
         
         # Test initial labels
-        self.assertEqual(self.ui.name_label['text'], "Name: -")
-        self.assertEqual(self.ui.house_label['text'], "House: -")
-        self.assertEqual(self.ui.health_label['text'], "Health: -")
-        self.assertEqual(self.ui.mana_label['text'], "Mana: -")
+        self.assertEqual(self.ui.name_var.get(), "Name: -")
+        self.assertEqual(self.ui.house_var.get(), "House: -")
+        self.assertEqual(self.ui.health_var.get(), "Health: -")
+        self.assertEqual(self.ui.mana_var.get(), "Mana: -")
     
     def test_update_stats(self):
         """Test updating player stats in the UI."""
         test_stats = {
             "Name": "Harry",
             "House": "Gryffindor",
-            "Health": "100/100",
-            "Mana": "100/100",
+            "Health": (100, 100),
+            "Mana": (100, 100),
             "Knowledge": 10,
             "House Points": 50,
             "Known Spells": ["Lumos", "Wingardium Leviosa"],
@@ -47,14 +47,16 @@ class TestHogwartsUI(unittest.TestCase):
         }
         
         self.ui.update_stats(test_stats)
-        
-        self.assertEqual(self.ui.name_label['text'], "Name: Harry")
-        self.assertEqual(self.ui.house_label['text'], "House: Gryffindor")
-        self.assertEqual(self.ui.health_label['text'], "Health: 100/100")
-        self.assertEqual(self.ui.mana_label['text'], "Mana: 100/100")
+        self.root.update()  # Process the coalesced idle refresh
+
+        self.assertEqual(self.ui.name_var.get(), "Name: Harry")
+        self.assertEqual(self.ui.house_var.get(), "House: Gryffindor")
+        self.assertEqual(self.ui.health_var.get(), "Health: 100/100")
+        self.assertEqual(self.ui.mana_var.get(), "Mana: 100/100")
         
         # Test spells list
-        spells = list(self.ui.spells_list.get(0, tk.END))
+        spells = [self.ui.spells_list.item(iid, 'text')
+                  for iid in self.ui.spells_list.get_children()]
         self.assertEqual(spells, ["Lumos", "Wingardium Leviosa"])
     
     def test_game_text_operations(self):
@@ -76,13 +78,13 @@ class TestHogwartsUI(unittest.TestCase):
         # Add some test spells
         test_spells = ["Lumos", "Wingardium Leviosa"]
         for spell in test_spells:
-            self.ui.spells_list.insert(tk.END, spell)
-        
+            self.ui.spells_list.insert('', tk.END, iid=spell, text=spell)
+
         # Initially no selection
         self.assertEqual(self.ui.get_selected_spell(), "")
-        
+
         # Simulate selection
-        self.ui.spells_list.selection_set(0)
+        self.ui.spells_list.selection_set("Lumos")
         self.assertEqual(self.ui.get_selected_spell(), "Lumos")
     
     def test_input_entry_submit(self):
@@ -1,9 +1,35 @@
 """
 Tkinter-based UI for the Harry Potter RPG game.
 """
+import textwrap
 import tkinter as tk
-from tkinter import ttk, scrolledtext
-from typing import Callable, Dict, Any
+from tkinter import ttk, scrolledtext, font as tkfont
+from typing import Callable, Dict, Any, List, Optional
+
+# Lines of scrollback kept in the game log; Text widgets slow down as the
+# buffer grows, so older history is discarded
+_MAX_LOG_LINES = 2000
+
+
+# Most PhotoImages kept alive at once by the image cache
+_MAX_CACHED_IMAGES = 32
+
+
+def _noop() -> None:
+    """Placeholder for button actions with no registered callback."""
+
+
+# Button action name -> attribute holding its callback, so a click costs an
+# attribute load instead of a dict probe
+_CALLBACK_ATTRS = {
+    "start_game": "_start_game_cb",
+    "explore": "_explore_cb",
+    "attend_class": "_attend_class_cb",
+    "duel": "_duel_cb",
+    "view_spellbook": "_view_spellbook_cb",
+    "submit_text": "_submit_cb",
+}
+
 
 class HogwartsUI:
     """Main UI class for the Hogwarts RPG game."""
@@ -23,51 +49,93 @@ class HogwartsUI:
         self.create_game_text_area()
         self.create_stats_panel()
         self.create_control_panel()
+
+        # Direct Tcl setters for the bar values, bypassing the
+        # kwargs-to-options translation in Misc.configure on every write
+        self._set_health_bar = self._bar_setter(self.health_bar)
+        self._set_mana_bar = self._bar_setter(self.mana_bar)
         
         # Initialize callback storage
         self.callbacks: Dict[str, Callable] = {}
+        self._start_game_cb: Callable = _noop
+        self._explore_cb: Callable = _noop
+        self._attend_class_cb: Callable = _noop
+        self._duel_cb: Callable = _noop
+        self._view_spellbook_cb: Callable = _noop
+        self._submit_cb: Optional[Callable] = None
+
+        # Shared PhotoImage instances, keyed by file path (see _image)
+        self._image_cache: Dict[str, tk.PhotoImage] = {}
+
+        # Last values written to the stats panel, for skipping unchanged widgets
+        self._last_stats: Dict[str, Any] = {}
+
+        # Pending stats refresh, coalesced onto the next idle cycle
+        self._pending_stats: Optional[Dict[str, Any]] = None
+        self._stats_after_id: Optional[str] = None
+
+        # Last integer percentages written to the bars; sub-percent health
+        # changes don't trigger a Progressbar relayout
+        self._last_health_pct = None
+        self._last_mana_pct = None
     
     def create_game_text_area(self) -> None:
         """Create the left side game text output area."""
         text_frame = ttk.Frame(self.root)
         text_frame.grid(row=0, column=0, sticky="nsew", padx=5, pady=5)
         
-        # Game text output
-        self.game_text = scrolledtext.ScrolledText(text_frame, wrap=tk.WORD)
+        # Game text output. The widget stays state=NORMAL so appends don't
+        # have to toggle state; swallowing <Key> makes it read-only anyway.
+        # With no undo stack, appends don't accumulate memory per insert.
+        # Text is pre-wrapped in Python (see _wrap) so Tk's word-wrap
+        # recalculation, which dominates as the buffer grows, stays off.
+        self.game_text = scrolledtext.ScrolledText(
+            text_frame, wrap=tk.NONE, undo=False, autoseparators=False, maxundo=0)
         self.game_text.pack(fill=tk.BOTH, expand=True)
-        self.game_text.config(state=tk.DISABLED)
+        self.game_text.bind('<Key>', lambda event: 'break')
+
+        self._log_width = 80  # Wrap column, refined on resize
+        self._log_font = tkfont.Font(font=self.game_text['font'])
+        self.game_text.bind('<Configure>', self._update_log_width)
     
     def create_stats_panel(self) -> None:
         """Create the right side stats panel."""
         stats_frame = ttk.Frame(self.root)
         stats_frame.grid(row=0, column=1, sticky="nsew", padx=5, pady=5)
         
-        # Player info labels
-        self.name_label = ttk.Label(stats_frame, text="Name: -")
+        # Player info labels, driven by StringVars so updates write the
+        # display string directly instead of going through config()
+        self.name_var = tk.StringVar(value="Name: -")
+        self.name_label = ttk.Label(stats_frame, textvariable=self.name_var)
         self.name_label.pack(fill=tk.X, padx=5, pady=2)
-        
-        self.house_label = ttk.Label(stats_frame, text="House: -")
+
+        self.house_var = tk.StringVar(value="House: -")
+        self.house_label = ttk.Label(stats_frame, textvariable=self.house_var)
         self.house_label.pack(fill=tk.X, padx=5, pady=2)
-        
+
         # Health and mana with progress bars
         health_frame = ttk.Frame(stats_frame)
         health_frame.pack(fill=tk.X, padx=5, pady=2)
-        self.health_label = ttk.Label(health_frame, text="Health: -")
+        self.health_var = tk.StringVar(value="Health: -")
+        self.health_label = ttk.Label(health_frame, textvariable=self.health_var)
         self.health_label.pack(side=tk.LEFT)
         self.health_bar = ttk.Progressbar(health_frame, length=100, mode='determinate')
         self.health_bar.pack(side=tk.RIGHT, fill=tk.X, expand=True)
-        
+
         mana_frame = ttk.Frame(stats_frame)
         mana_frame.pack(fill=tk.X, padx=5, pady=2)
-        self.mana_label = ttk.Label(mana_frame, text="Mana: -")
+        self.mana_var = tk.StringVar(value="Mana: -")
+        self.mana_label = ttk.Label(mana_frame, textvariable=self.mana_var)
         self.mana_label.pack(side=tk.LEFT)
         self.mana_bar = ttk.Progressbar(mana_frame, length=100, mode='determinate')
         self.mana_bar.pack(side=tk.RIGHT, fill=tk.X, expand=True)
-        
-        self.knowledge_label = ttk.Label(stats_frame, text="Knowledge: -")
+
+        self.knowledge_var = tk.StringVar(value="Knowledge: -")
+        self.knowledge_label = ttk.Label(stats_frame, textvariable=self.knowledge_var)
         self.knowledge_label.pack(fill=tk.X, padx=5, pady=2)
-        
-        self.points_label = ttk.Label(stats_frame, text="House Points: -")
+
+        self.points_var = tk.StringVar(value="House Points: -")
+        self.points_label = ttk.Label(stats_frame, textvariable=self.points_var)
         self.points_label.pack(fill=tk.X, padx=5, pady=2)
         
         # Status effects section
@@ -80,7 +148,9 @@ class HogwartsUI:
         spells_frame = ttk.Frame(stats_frame)
         spells_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=2)
         
-        self.spells_list = tk.Listbox(spells_frame)
+        # Flat Treeview rather than a Listbox, so refreshes can touch only
+        # the rows that changed instead of rebuilding every item
+        self.spells_list = ttk.Treeview(spells_frame, show='tree', selectmode='browse')
         self.spells_list.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
         spells_scrollbar = ttk.Scrollbar(spells_frame, orient=tk.VERTICAL, command=self.spells_list.yview)
@@ -96,26 +166,26 @@ class HogwartsUI:
         self.input_entry = ttk.Entry(control_frame)
         self.input_entry.pack(fill=tk.X, padx=5, pady=5)
         # Bind Enter key to input submission
-        self.input_entry.bind('<Return>', lambda event: self._handle_input_submit())
+        self.input_entry.bind('<Return>', self._handle_input_submit)
         
         # Buttons frame
         buttons_frame = ttk.Frame(control_frame)
         buttons_frame.pack(fill=tk.X, padx=5, pady=5)
         
-        # Action buttons
-        self.start_button = ttk.Button(buttons_frame, text="Start Game", command=lambda: self._trigger_callback("start_game"))
+        # Action buttons, each reading its callback attribute at click time
+        self.start_button = ttk.Button(buttons_frame, text="Start Game", command=lambda: self._start_game_cb())
         self.start_button.pack(side=tk.LEFT, padx=2)
-        
-        self.explore_button = ttk.Button(buttons_frame, text="Explore Hogwarts", command=lambda: self._trigger_callback("explore"))
+
+        self.explore_button = ttk.Button(buttons_frame, text="Explore Hogwarts", command=lambda: self._explore_cb())
         self.explore_button.pack(side=tk.LEFT, padx=2)
-        
-        self.class_button = ttk.Button(buttons_frame, text="Attend Class", command=lambda: self._trigger_callback("attend_class"))
+
+        self.class_button = ttk.Button(buttons_frame, text="Attend Class", command=lambda: self._attend_class_cb())
         self.class_button.pack(side=tk.LEFT, padx=2)
-        
-        self.duel_button = ttk.Button(buttons_frame, text="Duel NPC", command=lambda: self._trigger_callback("duel"))
+
+        self.duel_button = ttk.Button(buttons_frame, text="Duel NPC", command=lambda: self._duel_cb())
         self.duel_button.pack(side=tk.LEFT, padx=2)
-        
-        self.spellbook_button = ttk.Button(buttons_frame, text="View Spellbook", command=lambda: self._trigger_callback("view_spellbook"))
+
+        self.spellbook_button = ttk.Button(buttons_frame, text="View Spellbook", command=lambda: self._view_spellbook_cb())
         self.spellbook_button.pack(side=tk.LEFT, padx=2)
         
         # Initially disable game buttons
@@ -128,45 +198,132 @@ class HogwartsUI:
             button.config(state=state)
     
     def update_stats(self, stats: Dict[str, Any]) -> None:
-        """Update the stats panel with new player information."""
-        self.name_label.config(text=f"Name: {stats['Name']}")
-        self.house_label.config(text=f"House: {stats['House']}")
-        
-        # Update health and mana with progress bars
-        health, max_health = map(int, stats['Health'].split('/'))
-        self.health_label.config(text=f"Health: {stats['Health']}")
-        self.health_bar['value'] = (health / max_health) * 100
-        
-        mana, max_mana = map(int, stats['Mana'].split('/'))
-        self.mana_label.config(text=f"Mana: {stats['Mana']}")
-        self.mana_bar['value'] = (mana / max_mana) * 100
-        
-        self.knowledge_label.config(text=f"Knowledge: {stats['Knowledge']}")
-        self.points_label.config(text=f"House Points: {stats['House Points']}")
-        
-        # Update status effects
-        self.status_list.delete(0, tk.END)
-        if 'Status Effects' in stats:
-            for effect in stats['Status Effects']:
-                self.status_list.insert(tk.END, effect)
-        
-        # Update spells list
-        self.spells_list.delete(0, tk.END)
-        for spell in stats['Known Spells']:
-            self.spells_list.insert(tk.END, spell)
+        """
+        Queue a stats-panel refresh.
+
+        Rapid successive calls (e.g. several effects resolving in one
+        duel turn) are coalesced so the widgets are only updated once,
+        with the latest stats, on the next idle cycle.
+        """
+        self._pending_stats = stats
+        if self._stats_after_id is None:
+            self._stats_after_id = self.root.after_idle(self._flush_stats)
+
+    def _flush_stats(self) -> None:
+        """Apply the most recently queued stats to the widgets."""
+        stats, self._pending_stats = self._pending_stats, None
+        self._stats_after_id = None
+        if stats is not None:
+            self._apply_stats(stats)
+
+    def _apply_stats(self, stats: Dict[str, Any]) -> None:
+        """
+        Update the stats panel with new player information.
+
+        Each widget is only written when its value actually changed
+        since the last call, so steady-state refreshes cost a handful of
+        comparisons and no Tcl traffic.
+        """
+        last = self._last_stats
+
+        name = stats['Name']
+        if name != last.get('Name'):
+            self.name_var.set(f"Name: {name}")
+
+        house = stats['House']
+        if house != last.get('House'):
+            self.house_var.set(f"House: {house}")
+
+        # Update health and mana with progress bars; the producer hands
+        # over (cur, max) tuples so there is no string parsing here
+        health = stats['Health']
+        if health != last.get('Health'):
+            cur, max_health = health
+            self.health_var.set(f"Health: {cur}/{max_health}")
+            pct = cur * 100 // max_health
+            if pct != self._last_health_pct:
+                self._set_health_bar(pct)
+                self._last_health_pct = pct
+
+        mana = stats['Mana']
+        if mana != last.get('Mana'):
+            cur, max_mana = mana
+            self.mana_var.set(f"Mana: {cur}/{max_mana}")
+            pct = cur * 100 // max_mana
+            if pct != self._last_mana_pct:
+                self._set_mana_bar(pct)
+                self._last_mana_pct = pct
+
+        knowledge = stats['Knowledge']
+        if knowledge != last.get('Knowledge'):
+            self.knowledge_var.set(f"Knowledge: {knowledge}")
+
+        points = stats['House Points']
+        if points != last.get('House Points'):
+            self.points_var.set(f"House Points: {points}")
+
+        # Rebuild the status/spell lists (one insert call each) only on change
+        effects = list(stats.get('Status Effects') or ())
+        if effects != last.get('Status Effects'):
+            self.status_list.delete(0, tk.END)
+            if effects:
+                self.status_list.insert(tk.END, *effects)
+
+        spells = list(stats['Known Spells'])
+        if spells != last.get('Known Spells'):
+            existing = set(self.spells_list.get_children())
+            wanted = set(spells)
+            for iid in existing - wanted:
+                self.spells_list.delete(iid)
+            for spell in spells:
+                if spell not in existing:
+                    self.spells_list.insert('', tk.END, iid=spell, text=spell)
+
+        self._last_stats = {
+            'Name': name, 'House': house, 'Health': health, 'Mana': mana,
+            'Knowledge': knowledge, 'House Points': points,
+            'Status Effects': effects, 'Known Spells': spells,
+        }
     
+    def _update_log_width(self, event) -> None:
+        """Recompute the wrap column when the log widget is resized."""
+        char_px = self._log_font.measure('M')
+        if char_px > 0:
+            self._log_width = max(20, event.width // char_px)
+
+    def _wrap(self, text: str) -> str:
+        """Pre-wrap text to the current log width (Tk wrapping is off)."""
+        width = self._log_width
+        if len(text) <= width and '\n' not in text:
+            return text
+        return "\n".join(
+            textwrap.fill(line, width=width) if len(line) > width else line
+            for line in text.split("\n")
+        )
+
     def write_to_game_text(self, text: str) -> None:
         """Write text to the game output area."""
-        self.game_text.config(state=tk.NORMAL)
-        self.game_text.insert(tk.END, text + "\n")
-        self.game_text.see(tk.END)
-        self.game_text.config(state=tk.DISABLED)
-    
+        self.game_text.insert(tk.END, self._wrap(text) + "\n")
+        self._trim_log()
+        self.game_text.yview_moveto(1.0)
+
+    def write_many(self, lines: List[str]) -> None:
+        """Write several lines to the game output area with one insert."""
+        if not lines:
+            return
+        self.game_text.insert(tk.END, "\n".join(map(self._wrap, lines)) + "\n")
+        self._trim_log()
+        self.game_text.yview_moveto(1.0)
+
+    def _trim_log(self) -> None:
+        """Drop the oldest log lines once the buffer exceeds the cap."""
+        line_count = int(self.game_text.index('end-1c').split('.')[0])
+        if line_count > _MAX_LOG_LINES:
+            self.game_text.delete('1.0', f'{line_count - _MAX_LOG_LINES}.0')
+
     def clear_game_text(self) -> None:
         """Clear the game text area."""
-        self.game_text.config(state=tk.NORMAL)
         self.game_text.delete(1.0, tk.END)
-        self.game_text.config(state=tk.DISABLED)
     
     def get_input_text(self) -> str:
         """Get text from the input entry and clear it."""
@@ -174,14 +331,36 @@ class HogwartsUI:
         self.input_entry.delete(0, tk.END)
         return text
     
+    @staticmethod
+    def _bar_setter(bar: ttk.Progressbar) -> Callable:
+        """Return a direct Tcl setter for a Progressbar's -value option."""
+        tk_call = bar.tk.call
+        path = str(bar)
+        return lambda value: tk_call(path, 'configure', '-value', value)
+
+    def _image(self, path: str) -> tk.PhotoImage:
+        """
+        Return a shared PhotoImage for the given file path.
+
+        Any widget.config(image=...) call must go through this helper;
+        re-creating PhotoImages on each update churns Tcl-side image
+        objects, which leaks on some platforms. The cache is bounded,
+        evicting its oldest entry first.
+        """
+        image = self._image_cache.get(path)
+        if image is None:
+            if len(self._image_cache) >= _MAX_CACHED_IMAGES:
+                self._image_cache.pop(next(iter(self._image_cache)))
+            image = tk.PhotoImage(file=path)
+            self._image_cache[path] = image
+        return image
+
     def register_callback(self, action: str, callback: Callable) -> None:
         """Register a callback function for a specific action."""
         self.callbacks[action] = callback
-    
-    def _trigger_callback(self, action: str) -> None:
-        """Trigger a registered callback function."""
-        if action in self.callbacks:
-            self.callbacks[action]()
+        attr = _CALLBACK_ATTRS.get(action)
+        if attr is not None:
+            setattr(self, attr, callback)
     
     def start_game_mode(self) -> None:
         """Switch UI to game mode after starting."""
@@ -190,16 +369,15 @@ class HogwartsUI:
     
     def get_selected_spell(self) -> str:
         """Get the currently selected spell from the spells list."""
-        selection = self.spells_list.curselection()
-        if selection:
-            return self.spells_list.get(selection[0])
-        return ""
+        selection = self.spells_list.selection()
+        return selection[0] if selection else ""
     
-    def _handle_input_submit(self) -> None:
+    def _handle_input_submit(self, event=None) -> None:
         """Handle input submission when Enter key is pressed."""
         text = self.get_input_text()
-        if "submit_text" in self.callbacks and self.callbacks["submit_text"] is not None:
-            self.callbacks["submit_text"](text)
+        cb = self._submit_cb
+        if cb is not None:
+            cb(text)
         
     def run(self) -> None:
         """Start the UI main loop."""
@@ -2,120 +2,157 @@
 Utility functions for the Harry Potter RPG game.
 Contains helper functions like the sorting hat quiz and random events.
 """
+import os
 import random
-from typing import Dict, List, Tuple
+import sys
+from typing import Dict, List, Sequence, Tuple
 
 
 def clear_screen() -> None:
     """Clear the console screen."""
-    print("\n" * 50)
+    if os.name == 'nt':
+        os.system('cls')
+    else:
+        # One ANSI clear+home write instead of scrolling 50 blank lines
+        sys.stdout.write("\x1b[2J\x1b[H")
+        sys.stdout.flush()
 
 
-def get_valid_input(prompt: str, valid_options: List[str]) -> str:
+def get_valid_input(prompt: str, valid_options: Sequence[str]) -> str:
     """
     Get user input and validate it against a list of valid options.
-    
+
     Args:
         prompt: The prompt to show the user
-        valid_options: List of valid input options
-        
+        valid_options: Sequence of valid input options
+
     Returns:
         str: The validated user input
     """
+    valid_set = frozenset(valid_options)
+    error_message = f"Invalid input. Please choose from: {', '.join(valid_options)}"
     while True:
         user_input = input(prompt).strip().lower()
-        if user_input in valid_options:
+        if user_input in valid_set:
             return user_input
-        print(f"Invalid input. Please choose from: {', '.join(valid_options)}")
+        print(error_message)
+
+
+def get_int_in_range(prompt: str, lo: int, hi: int) -> int:
+    """
+    Get a numeric choice from the user within an inclusive range.
+
+    Unlike get_valid_input, no list of option strings is built; the
+    input is parsed once and range-checked.
+
+    Args:
+        prompt: The prompt to show the user
+        lo: Lowest accepted value
+        hi: Highest accepted value
+
+    Returns:
+        int: The validated number
+    """
+    while True:
+        try:
+            value = int(input(prompt).strip())
+            if lo <= value <= hi:
+                return value
+        except ValueError:
+            pass
+        print(f"Invalid input. Please enter a number between {lo} and {hi}.")
+
+
+_HOUSES = ("gryffindor", "slytherin", "hufflepuff", "ravenclaw")
+
+# Sorting-hat questions as (question, option texts) tuples; each option
+# tuple lists the houses in _HOUSES order, so the chosen house is found
+# by index instead of a dict probe
+_QUIZ_QUESTIONS = (
+    ("Which quality do you value most?",
+     ("Courage", "Ambition", "Loyalty", "Wisdom")),
+    ("Which pet would you bring to Hogwarts?",
+     ("Lion", "Snake", "Badger", "Eagle")),
+    ("How would you like to be remembered?",
+     ("The Bold", "The Great", "The Good", "The Wise")),
+)
+_QUIZ_KEYS = ("1", "2", "3", "4")
 
 
 def sorting_hat_quiz() -> str:
     """
     Run the sorting hat quiz to determine the player's house.
-    
+
     Returns:
         str: The chosen house name
     """
-    # Questions and their house affinities
-    questions = [
-        {
-            "question": "Which quality do you value most?",
-            "options": {
-                "1": ("Courage", "gryffindor"),
-                "2": ("Ambition", "slytherin"),
-                "3": ("Loyalty", "hufflepuff"),
-                "4": ("Wisdom", "ravenclaw")
-            }
-        },
-        {
-            "question": "Which pet would you bring to Hogwarts?",
-            "options": {
-                "1": ("Lion", "gryffindor"),
-                "2": ("Snake", "slytherin"),
-                "3": ("Badger", "hufflepuff"),
-                "4": ("Eagle", "ravenclaw")
-            }
-        },
-        {
-            "question": "How would you like to be remembered?",
-            "options": {
-                "1": ("The Bold", "gryffindor"),
-                "2": ("The Great", "slytherin"),
-                "3": ("The Good", "hufflepuff"),
-                "4": ("The Wise", "ravenclaw")
-            }
-        }
-    ]
-    
     # Track house points
-    house_points = {
-        "gryffindor": 0,
-        "slytherin": 0,
-        "hufflepuff": 0,
-        "ravenclaw": 0
-    }
-    
+    house_points = dict.fromkeys(_HOUSES, 0)
+
     print("\nThe Sorting Hat will now determine your house!")
-    
+
     # Ask each question
-    for q in questions:
-        print(f"\n{q['question']}")
-        for num, (option, _) in q['options'].items():
-            print(f"{num}. {option}")
-        
+    for question, options in _QUIZ_QUESTIONS:
+        print(f"\n{question}")
+        for i, option in enumerate(options, 1):
+            print(f"{i}. {option}")
+
         # Get valid input
-        choice = get_valid_input("Your choice (1-4): ", list(q['options'].keys()))
-        
+        choice = get_valid_input("Your choice (1-4): ", _QUIZ_KEYS)
+
         # Award point to chosen house
-        _, house = q['options'][choice]
-        house_points[house] += 1
-    
-    # Find house with most points (random tiebreaker)
-    max_points = max(house_points.values())
-    chosen_house = random.choice([
-        house for house, points in house_points.items()
-        if points == max_points
-    ])
+        house_points[_HOUSES[int(choice) - 1]] += 1
     
+    # Find the house with most points, breaking ties uniformly at random
+    # in a single reservoir-style pass
+    chosen_house = None
+    best_points = -1
+    tie_count = 0
+    for house, points in house_points.items():
+        if points > best_points:
+            chosen_house, best_points, tie_count = house, points, 1
+        elif points == best_points:
+            tie_count += 1
+            if random.random() < 1 / tie_count:
+                chosen_house = house
+
     return chosen_house.capitalize()
 
 
+# Exploration events as parallel tuples so drawing one allocates nothing
+_EVENT_TEXTS = (
+    "You found a secret passage! +10 points",
+    "You helped a lost first-year student. +5 points",
+    "You discovered a magical artifact! +15 points",
+    "You were caught out after curfew! -10 points",
+    "You successfully answered a riddle from a portrait. +5 points",
+    "You found and returned a lost wand. +10 points",
+    "You accidentally set off a dungbomb! -5 points",
+    "You helped Hagrid with magical creatures. +15 points",
+)
+_EVENT_POINTS = (10, 5, 15, -10, 5, 10, -5, 15)
+
+
 def generate_random_event() -> Tuple[str, int]:
     """
     Generate a random event for exploration.
-    
+
     Returns:
         Tuple[str, int]: (event description, house points earned/lost)
     """
-    events = [
-        ("You found a secret passage! +10 points", 10),
-        ("You helped a lost first-year student. +5 points", 5),
-        ("You discovered a magical artifact! +15 points", 15),
-        ("You were caught out after curfew! -10 points", -10),
-        ("You successfully answered a riddle from a portrait. +5 points", 5),
-        ("You found and returned a lost wand. +10 points", 10),
-        ("You accidentally set off a dungbomb! -5 points", -5),
-        ("You helped Hagrid with magical creatures. +15 points", 15)
-    ]
-    
-    return random.choice(events)
\ No newline at end of file
+    i = random.randrange(len(_EVENT_TEXTS))
+    return _EVENT_TEXTS[i], _EVENT_POINTS[i]
+
+
+def generate_random_events(n: int) -> List[Tuple[str, int]]:
+    """
+    Generate a batch of random exploration events.
+
+    Args:
+        n: Number of events to generate
+
+    Returns:
+        List[Tuple[str, int]]: (description, points) pairs
+    """
+    indices = random.choices(range(len(_EVENT_TEXTS)), k=n)
+    return [(_EVENT_TEXTS[i], _EVENT_POINTS[i]) for i in indices]
\ No newline at end of file